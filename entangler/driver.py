@@ -8,6 +8,7 @@ from artiq.coredevice.rtio import rtio_input_data
 from artiq.coredevice.rtio import rtio_input_timestamped_data
 from artiq.coredevice.rtio import rtio_output
 from artiq.language.core import delay_mu
+from artiq.language.core import host_only
 from artiq.language.core import kernel
 
 # Write only
@@ -41,6 +42,17 @@ timestamp_422ps = 0b11000 + 4
 class Entangler:
     """Sequences remote entanglement experiments between a master and a slave."""
 
+    kernel_invariants = {
+        "core",
+        "channel",
+        "is_master",
+        "ref_period_mu",
+        "_waddr_config",
+        "_waddr_run",
+        "_waddr_tcycle",
+        "_waddr_herald",
+    }
+
     def __init__(self, dmgr, channel, is_master=True, core_device="core"):
         """Fast sequencer for generating remote entanglement.
 
@@ -55,6 +67,21 @@ class Entangler:
         self.channel = channel
         self.is_master = is_master
         self.ref_period_mu = self.core.seconds_to_mu(self.core.coarse_ref_period)
+        # Pre-shifted RTIO destination words for the fixed registers, so the
+        # compiler emits them as immediates instead of redoing
+        # (channel << 8) | addr on every write.
+        self._waddr_config = (channel << 8) | ADDR_W_CONFIG
+        self._waddr_run = (channel << 8) | ADDR_W_RUN
+        self._waddr_tcycle = (channel << 8) | ADDR_W_TCYCLE
+        self._waddr_herald = (channel << 8) | ADDR_W_HERALD
+        # Host-side conversion factor for the seconds-based convenience
+        # methods; avoids dispatching into self.core per call.
+        self._mu_per_sec = 1.0 / self.core.ref_period
+
+    @host_only
+    def _seconds_to_mu(self, t):
+        """Convert seconds to mu on the host using the cached clock period."""
+        return int(round(t * self._mu_per_sec))
 
     @kernel
     def init(self):
@@ -71,9 +98,32 @@ class Entangler:
             addr: parameter memory address.
             value: Data to be written.
         """
-        rtio_output((self.channel << 8) | addr, value)
+        self._raw_write((self.channel << 8) | addr, value)
+
+    @kernel
+    def _raw_write(self, waddr, value):
+        """Write a pre-shifted destination word (see ``_waddr_*``)."""
+        rtio_output(waddr, value)
         delay_mu(self.ref_period_mu)
 
+    @kernel
+    def write_burst(self, addrs, values):
+        """Write several parameters back-to-back.
+
+        The gateware decodes one register write per coarse RTIO cycle, so
+        events on this channel must be spaced by at least one coarse cycle.
+        This method issues all writes at that minimum spacing, advancing the
+        timeline by ``len(addrs)`` coarse cycles in total, instead of paying
+        the slack of one :meth:`write` call per register.
+
+        Args:
+            addrs: list of parameter memory addresses.
+            values: list of data words, one per address.
+        """
+        for i in range(len(addrs)):
+            rtio_output((self.channel << 8) | addrs[i], values[i])
+            delay_mu(self.ref_period_mu)
+
     @kernel
     def read(self, addr):
         """Read parameter.
@@ -90,6 +140,46 @@ class Entangler:
         rtio_output((self.channel << 8) | addr, 0)
         return rtio_input_data(self.channel)
 
+    @kernel
+    def read_many(self, addrs):
+        """Read several parameters with one round-trip of latency.
+
+        All read requests are issued first, spaced one coarse cycle apart,
+        and the replies are drained afterwards, so the core CPU stalls for a
+        single round-trip instead of once per register as with :meth:`read`.
+        The RTIO input buffer holds about 16 replies, so keep ``addrs`` no
+        longer than that.
+
+        Args:
+            addrs: list of register addresses to read.
+
+        Returns:
+            List of register values, in the same order as ``addrs``.
+        """
+        assert len(addrs) <= 16
+        results = [0] * len(addrs)
+        for i in range(len(addrs)):
+            rtio_output((self.channel << 8) | addrs[i], 0)
+            delay_mu(self.ref_period_mu)
+        for i in range(len(addrs)):
+            results[i] = rtio_input_data(self.channel)
+        return results
+
+    @kernel
+    def snapshot(self):
+        """Read status, cycle, trigger and time-remaining counters at once.
+
+        Single-round-trip equivalent of calling :meth:`get_status`,
+        :meth:`get_ncycles`, :meth:`get_ntriggers` and
+        :meth:`get_time_remaining` back-to-back.
+
+        Returns:
+            List ``[status, ncycles, ntriggers, time_remaining]``.
+        """
+        return self.read_many(
+            [ADDR_R_STATUS, ADDR_R_NCYCLES, ADDR_R_NTRIGGERS, ADDR_R_TIMEREMAINING]
+        )
+
     @kernel
     def set_config(self, enable=False, standalone=False):
         """Configure the core gateware.
@@ -108,7 +198,7 @@ class Entangler:
             data |= 1 << 1
         if standalone:
             data |= 1 << 2
-        self.write(ADDR_W_CONFIG, data)
+        self._raw_write(self._waddr_config, data)
 
     @kernel
     def set_timing_mu(self, channel, t_start_mu, t_stop_mu):
@@ -127,25 +217,77 @@ class Entangler:
         length. If the start is after the cycle length there is no pulse.
         """
         if channel < gate_apd0:
-            t_start_mu = t_start_mu >> 3
-            t_stop_mu = t_stop_mu >> 3
+            self.set_output_timing_mu(channel, t_start_mu, t_stop_mu)
+        else:
+            self.set_gate_timing_mu(channel, t_start_mu, t_stop_mu)
 
-        t_start_mu += 1
-        t_stop_mu += 1
+    @kernel
+    def set_output_timing_mu(self, channel, t_start_mu, t_stop_mu):
+        """Set the timing of an output (sequencer) channel.
 
-        # Truncate to 14 bits
-        t_start_mu &= 0x3FFF
-        t_stop_mu &= 0x3FFF
+        Specialized for ``channel < gate_apd0``: the coarse-resolution
+        conversion is unconditional, so loops over output channels compile
+        without the per-call output-vs-gate branch of :meth:`set_timing_mu`.
+        Times are in mu, relative to the start of the entanglement cycle.
+        """
+        # Coarse (8ns) resolution; truncate to 14 bits.
+        t_start_mu = ((t_start_mu >> 3) + 1) & 0x3FFF
+        t_stop_mu = ((t_stop_mu >> 3) + 1) & 0x3FFF
         self.write(channel, (t_stop_mu << 16) | t_start_mu)
 
     @kernel
+    def set_gate_timing_mu(self, channel, t_start_mu, t_stop_mu):
+        """Set the timing of a gate (APD input) channel.
+
+        Specialized for ``channel >= gate_apd0``: fine (1ns) resolution,
+        times relative to the 422 reference pulse, no per-call branch.
+        """
+        # Truncate to 14 bits.
+        t_start_mu = (t_start_mu + 1) & 0x3FFF
+        t_stop_mu = (t_stop_mu + 1) & 0x3FFF
+        self.write(channel, (t_stop_mu << 16) | t_start_mu)
+
+    @kernel
+    def set_timings_mu(self, channels, t_starts_mu, t_stops_mu):
+        """Set the timing of several channels in one burst.
+
+        Equivalent to calling :meth:`set_timing_mu` once per channel, but the
+        writes are packed at the minimum one-coarse-cycle spacing the gateware
+        allows, so configuring all outputs and gates costs
+        ``len(channels)`` coarse cycles of timeline rather than a full
+        :meth:`write` per channel.
+        """
+        for i in range(len(channels)):
+            t_start_mu = t_starts_mu[i]
+            t_stop_mu = t_stops_mu[i]
+            if channels[i] < gate_apd0:
+                t_start_mu = t_start_mu >> 3
+                t_stop_mu = t_stop_mu >> 3
+
+            t_start_mu += 1
+            t_stop_mu += 1
+
+            # Truncate to 14 bits
+            t_start_mu &= 0x3FFF
+            t_stop_mu &= 0x3FFF
+            rtio_output(
+                (self.channel << 8) | channels[i], (t_stop_mu << 16) | t_start_mu
+            )
+            delay_mu(self.ref_period_mu)
+
+    @host_only
     def set_timing(self, channel, t_start, t_stop):
         """Set the output channel timing and relative gate times.
 
         Times are in seconds. See set_timing_mu() for details.
+
+        Host-side convenience: the seconds-to-mu conversion runs on the host
+        and only :meth:`set_timing_mu` executes on the core device. From
+        kernel code, convert once on the host and call the ``_mu`` variant
+        directly.
         """
-        t_start_mu = np.int32(self.core.seconds_to_mu(t_start))
-        t_stop_mu = np.int32(self.core.seconds_to_mu(t_stop))
+        t_start_mu = np.int32(self._seconds_to_mu(t_start))
+        t_stop_mu = np.int32(self._seconds_to_mu(t_stop))
         self.set_timing_mu(channel, t_start_mu, t_stop_mu)
 
     @kernel
@@ -156,15 +298,17 @@ class Entangler:
         repeats. Resolution is coarse_ref_period.
         """
         t_cycle_mu = t_cycle_mu >> 3
-        self.write(ADDR_W_TCYCLE, t_cycle_mu)
+        self._raw_write(self._waddr_tcycle, t_cycle_mu)
 
-    @kernel
+    @host_only
     def set_cycle_length(self, t_cycle):
         """Set the entanglement cycle length.
 
-        Times are in seconds.
+        Times are in seconds. Host-side convenience wrapper around
+        :meth:`set_cycle_length_mu`; the conversion does not run on the core
+        device.
         """
-        t_cycle_mu = np.int32(self.core.seconds_to_mu(t_cycle))
+        t_cycle_mu = np.int32(self._seconds_to_mu(t_cycle))
         self.set_cycle_length_mu(t_cycle_mu)
 
     @kernel
@@ -178,12 +322,66 @@ class Entangler:
         to herald on apd1_b, apd2_b: set_heralds(0b1010)
         To herald on both: set_heralds(0b0001, 0b1010).
         """
-        data = 0
+        # At most 4 patterns, so unroll: each clause is a constant-shift OR
+        # mask, which compiles to straight-line code on the core CPU instead
+        # of a dynamic loop over the list.
         assert len(heralds) <= 4
-        for i in range(len(heralds)):
-            data |= (heralds[i] & 0xF) << (4 * i)
-            data |= 1 << (16 + i)
-        self.write(ADDR_W_HERALD, data)
+        data = 0
+        if len(heralds) > 0:
+            data |= ((heralds[0] & 0xF) << 0) | (1 << 16)
+        if len(heralds) > 1:
+            data |= ((heralds[1] & 0xF) << 4) | (1 << 17)
+        if len(heralds) > 2:
+            data |= ((heralds[2] & 0xF) << 8) | (1 << 18)
+        if len(heralds) > 3:
+            data |= ((heralds[3] & 0xF) << 12) | (1 << 19)
+        self._raw_write(self._waddr_herald, data)
+
+    @kernel
+    def configure_all(self, cycle_mu, heralds, channels, t_starts_mu, t_stops_mu):
+        """Apply a complete core configuration in one kernel.
+
+        Bundles :meth:`set_cycle_length_mu`, :meth:`set_timings_mu` and
+        :meth:`set_heralds` so the whole setup compiles (and runs) as a
+        single kernel rather than one tiny kernel per parameter. Preferred
+        entry point when the configuration is known up front.
+
+        Args:
+            cycle_mu: entanglement cycle length, in mu.
+            heralds: herald patterns, as accepted by :meth:`set_heralds`.
+            channels: timing channel addresses (outputs and gates).
+            t_starts_mu: start time per entry of ``channels``, in mu.
+            t_stops_mu: stop time per entry of ``channels``, in mu.
+        """
+        self.set_cycle_length_mu(cycle_mu)
+        self.set_timings_mu(channels, t_starts_mu, t_stops_mu)
+        self.set_heralds(heralds)
+
+    @kernel
+    def submit_run_mu(self, duration_mu):
+        """Start the entanglement sequence without waiting for the result.
+
+        Unlike :meth:`run_mu` this returns as soon as the run command is
+        issued, so the kernel can schedule unrelated RTIO events (on other
+        channels) or do host RPCs while the core runs. Collect the outcome
+        with :meth:`await_run_result` before issuing further commands on
+        this channel.
+
+        Args:
+            duration_mu (int): Timeout duration of this entanglement cycle, in mu.
+        """
+        duration_mu = duration_mu >> 3
+        self._raw_write(self._waddr_run, duration_mu)
+
+    @kernel
+    def await_run_result(self):
+        """Block until the previously submitted run finishes.
+
+        See :meth:`run_mu` for the meaning of the return value.
+        """
+        # Following func is only in ARTIQ >= 5, don't have in dev environment
+        # pylint: disable=no-name-in-module
+        return rtio_input_timestamped_data(np.int64(-1), self.channel)
 
     @kernel
     def run_mu(self, duration_mu):
@@ -201,20 +399,18 @@ class Entangler:
             herald matches if there was a success.
 
         """
-        duration_mu = duration_mu >> 3
-        self.write(ADDR_W_RUN, duration_mu)
-        # Following func is only in ARTIQ >= 5, don't have in dev environment
-        # pylint: disable=no-name-in-module
-        return rtio_input_timestamped_data(np.int64(-1), self.channel)
+        self.submit_run_mu(duration_mu)
+        return self.await_run_result()
 
-    @kernel
+    @host_only
     def run(self, duration):
         """Run the entanglement sequence.
 
         See run_mu() for details. NOTE: this is a blocking call.
-        Duration is in seconds.
+        Duration is in seconds. The conversion to mu happens on the host;
+        only :meth:`run_mu` executes on the core device.
         """
-        duration_mu = np.int32(self.core.seconds_to_mu(duration))
+        duration_mu = np.int32(self._seconds_to_mu(duration))
         return self.run_mu(duration_mu)
 
     @kernel
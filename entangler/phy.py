@@ -1,6 +1,6 @@
 """Gateware-side ARTIQ RTIO interface to the entangler core."""
 from artiq.gateware.rtio import rtlink
-from migen import Case
+from migen import Array
 from migen import Cat
 from migen import ClockDomainsRenamer
 from migen import If
@@ -31,6 +31,13 @@ class Entangler(Module):
                 core not running
             input_phys: serdes phys for 5 inputs – APD0-3 and 422ps trigger in
         """
+        # Fail before any signal or submodule is allocated, and survive
+        # python -O (a bare assert would be stripped).
+        if len(input_phys) != 5:
+            raise ValueError(
+                "input_phys must hold 5 phys (APD0-3 and the 422ps reference),"
+                " got {}".format(len(input_phys))
+            )
         self.rtlink = rtlink.Interface(
             rtlink.OInterface(data_width=32, address_width=5, enable_replace=False),
             rtlink.IInterface(data_width=14, timestamped=True),
@@ -48,86 +55,126 @@ class Entangler(Module):
             )
         )
 
-        read_en = self.rtlink.o.address[4]
+        # Register the output interface before decoding. The address fans out
+        # to many comparators and the data bus into wide parameter registers;
+        # decoding from these copies keeps that cone off the RTIO bus itself
+        # and costs one rio cycle of write latency, which nothing is
+        # sensitive to.
+        addr_r = Signal.like(self.rtlink.o.address)
+        data_r = Signal.like(self.rtlink.o.data)
+        stb_r = Signal()
+        self.sync.rio += [
+            addr_r.eq(self.rtlink.o.address),
+            data_r.eq(self.rtlink.o.data),
+            stb_r.eq(self.rtlink.o.stb),
+        ]
+
+        read_en = addr_r[4]
         write_timings = Signal()
+        # One shared strobe-qualified decode per write register; every
+        # consumer below uses these instead of instantiating its own
+        # address comparator.
+        sel_config = Signal()
+        sel_run = Signal()
+        sel_tcycle = Signal()
+        sel_herald = Signal()
         self.comb += [
             self.rtlink.o.busy.eq(0),
-            write_timings.eq(self.rtlink.o.address[3:5] == 1),
+            write_timings.eq(addr_r[3:5] == 1),
+            sel_config.eq((addr_r == 0) & stb_r),
+            sel_run.eq((addr_r == 1) & stb_r),
+            sel_tcycle.eq((addr_r == 2) & stb_r),
+            sel_herald.eq((addr_r == 3) & stb_r),
         ]
 
-        output_t_starts = [seq.m_start for seq in self.core.sequencers]
-        output_t_ends = [seq.m_stop for seq in self.core.sequencers]
-        output_t_starts += [gater.gate_start for gater in self.core.apd_gaters]
-        output_t_ends += [gater.gate_stop for gater in self.core.apd_gaters]
-        cases = {}
-        for i in range(len(output_t_starts)):
-            cases[i] = [
-                output_t_starts[i].eq(self.rtlink.o.data[:16]),
-                output_t_ends[i].eq(self.rtlink.o.data[16:]),
-            ]
-
-        # Write timeout counter and start core running
+        output_t_starts = Array(
+            [seq.m_start for seq in self.core.sequencers]
+            + [gater.gate_start for gater in self.core.apd_gaters]
+        )
+        output_t_ends = Array(
+            [seq.m_stop for seq in self.core.sequencers]
+            + [gater.gate_stop for gater in self.core.apd_gaters]
+        )
+
+        # Write timeout counter and start core running. data_r is already a
+        # registered copy of the data bus (see above), so the state machine
+        # can capture the timeout straight from it on the run strobe; its
+        # own If(run_stb, ...) load is the clock enable. Re-registering a
+        # buffer and strobe here would push the run start a second cycle
+        # behind the RTIO write and break the documented run/timeout timing
+        # (see the timeout test in test_phy.py).
         self.comb += [
-            self.core.msm.time_remaining_buf.eq(self.rtlink.o.data),
-            self.core.msm.run_stb.eq((self.rtlink.o.address == 1) & self.rtlink.o.stb),
+            self.core.msm.time_remaining_buf.eq(data_r),
+            self.core.msm.run_stb.eq(sel_run),
         ]
 
         self.sync.rio += [
             If(
-                write_timings & self.rtlink.o.stb,
-                Case(self.rtlink.o.address[:3], cases),
+                write_timings & stb_r,
+                # Two indexed stores instead of a Case branch per channel:
+                # one write-demux cone from the data bus to the timing
+                # register file.
+                output_t_starts[addr_r[:3]].eq(data_r[:16]),
+                output_t_ends[addr_r[:3]].eq(data_r[16:]),
             ),
             If(
-                (self.rtlink.o.address == 0) & self.rtlink.o.stb,
+                sel_config,
                 # Write config
-                self.core.enable.eq(self.rtlink.o.data[0]),
-                self.core.msm.standalone.eq(self.rtlink.o.data[2]),
+                self.core.enable.eq(data_r[0]),
+                self.core.msm.standalone.eq(data_r[2]),
             ),
             If(
-                (self.rtlink.o.address == 2) & self.rtlink.o.stb,
+                sel_tcycle,
                 # Write cycle length
-                self.core.msm.m_end.eq(self.rtlink.o.data[:10]),
+                self.core.msm.m_end.eq(data_r[:10]),
             ),
             If(
-                (self.rtlink.o.address == 3) & self.rtlink.o.stb,
+                sel_herald,
                 # Write herald patterns and enables
-                *[
-                    self.core.heralder.patterns[i].eq(
-                        self.rtlink.o.data[4 * i : 4 * (i + 1)]  # noqa
-                    )
-                    for i in range(4)
-                ],
-                self.core.heralder.pattern_ens.eq(self.rtlink.o.data[16:20])
+                self.core.heralder.patterns_flat.eq(
+                    data_r[: len(self.core.heralder.patterns_flat)]
+                ),
+                self.core.heralder.pattern_ens.eq(data_r[16:20]),
             ),
         ]
 
         # Write is_master bit in rio_phy reset domain to not break 422ps trigger
-        # forwarding on core.reset().
+        # forwarding on core.reset(). Decode the write once in rio and hand
+        # only the two resulting bits across, so the bus/decode nets are
+        # consumed by a single domain (rio and rio_phy share a clock and
+        # differ only in reset, so plain registers suffice).
+        is_master_we = Signal()
+        is_master_d = Signal()
+        self.sync.rio += [
+            is_master_we.eq(sel_config),
+            is_master_d.eq(data_r[1]),
+        ]
         self.sync.rio_phy += If(
-            (self.rtlink.o.address == 0) & self.rtlink.o.stb,
-            self.core.msm.is_master.eq(self.rtlink.o.data[1]),
+            is_master_we,
+            self.core.msm.is_master.eq(is_master_d),
         )
 
         read = Signal()
         read_timings = Signal()
-        read_addr = Signal(3)
 
         # Input timestamps are [apd0, apd1, apd2, apd3, ref]
         input_timestamps = [gater.sig_ts for gater in self.core.apd_gaters]
         input_timestamps.append(self.core.apd_gaters[0].ref_ts)
-        cases = {}
-        timing_data = Signal(14)
-        for i, ts in enumerate(input_timestamps):
-            cases[i] = [timing_data.eq(ts)]
-        self.comb += Case(read_addr, cases)
+
+        # The read index must span both the status/counter registers and the
+        # timestamp list; derive its width from whichever is larger so adding
+        # inputs cannot silently truncate the address, and so the read muxes
+        # are exactly as deep as the source lists require.
+        num_read_sources = max(len(input_timestamps), 4)
+        read_addr = Signal(max(1, (num_read_sources - 1).bit_length()))
 
         self.sync.rio += [
             If(read, read.eq(0)),
             If(
-                self.rtlink.o.stb,
+                stb_r,
                 read.eq(read_en),
-                read_timings.eq(self.rtlink.o.address[3:5] == 0b11),
-                read_addr.eq(self.rtlink.o.address[:3]),
+                read_timings.eq(addr_r[3:5] == 0b11),
+                read_addr.eq(addr_r[:3]),
             ),
         ]
 
@@ -136,13 +183,30 @@ class Entangler(Module):
             Cat(self.core.msm.ready, self.core.msm.success, self.core.msm.timeout)
         )
 
-        reg_read = Signal(14)
-        cases = {}
-        cases[0] = [reg_read.eq(status)]
-        cases[1] = [reg_read.eq(self.core.msm.cycles_completed)]
-        cases[2] = [reg_read.eq(self.core.msm.time_remaining)]
-        cases[3] = [reg_read.eq(self.core.triggers_received)]
-        self.comb += Case(read_addr, cases)
+        # All read sources in one flat table indexed by the timings bit and
+        # the read address together, so the register and timestamp muxes
+        # share a single decoder. Unused slots are padded with zeros up to
+        # the index power of two.
+        slots = 2 ** len(read_addr)
+        register_sources = [
+            status,
+            self.core.msm.cycles_completed,
+            self.core.msm.time_remaining,
+            self.core.triggers_received,
+        ]
+        read_sources = register_sources + [0] * (slots - len(register_sources))
+        read_sources += input_timestamps + [0] * (slots - len(input_timestamps))
+
+        # Register the selected read value. The fused mux spans counter and
+        # timestamp sources across the core, so it gets its own pipeline
+        # stage and the input event is strobed from a matching delayed read
+        # flag.
+        read_d = Signal()
+        muxed_read = Signal(14)
+        self.sync.rio += [
+            read_d.eq(read),
+            muxed_read.eq(Array(read_sources)[Cat(read_addr, read_timings)]),
+        ]
 
         # Generate an input event if we have a read request RTIO Output event, or if the
         # core has finished. If the core is finished output the herald match, or 0x3fff
@@ -151,12 +215,12 @@ class Entangler(Module):
         # Simultaneous read requests and core-done events are not currently handled, but
         # are easy to avoid in the client code.
         self.comb += [
-            self.rtlink.i.stb.eq(read | self.core.enable & self.core.msm.done_stb),
+            self.rtlink.i.stb.eq(read_d | self.core.enable & self.core.msm.done_stb),
             self.rtlink.i.data.eq(
                 Mux(
                     self.core.enable & self.core.msm.done_stb,
                     Mux(self.core.msm.success, self.core.heralder.matches, 0x3FFF),
-                    Mux(read_timings, timing_data, reg_read),
+                    muxed_read,
                 )
             ),
         ]
@@ -0,0 +1,9 @@
+"""Pytest collection settings for the gateware simulation tests."""
+import importlib.util
+
+collect_ignore = []
+if importlib.util.find_spec("artiq") is None:
+    # test_phy.py exercises the RTIO interface and needs the ARTIQ gateware
+    # package; without it the import error would abort collection of the
+    # whole suite, so skip just that file.
+    collect_ignore.append("test_phy.py")
@@ -4,6 +4,12 @@ from migen import Module
 from migen import Signal
 
 
+def advance_clock(cycles):
+    """Advance the simulation by a fixed number of clock cycles."""
+    for _ in range(cycles):
+        yield
+
+
 def rtio_output_event(rtlink, addr, data):
     """Simulate a RTIO output event happening on the RTIO bus."""
     yield rtlink.o.address.eq(addr)
@@ -23,12 +29,13 @@ class MockPhy(Module):
         self.t_event = Signal(32)
 
         # # #
-        self.sync += [
-            self.stb_rising.eq(0),
-            self.fine_ts.eq(0),
-            If(
-                counter == self.t_event[3:],
-                self.stb_rising.eq(1),
-                self.fine_ts.eq(self.t_event[:3]),
-            ),
-        ]
+        # Purely combinational: the strobe and fine timestamp are only
+        # driven while the counter matches the event time, and fall back to
+        # their zero defaults otherwise. This avoids clocking two explicit
+        # zero-resets through every PHY every cycle and reports the event on
+        # the matching cycle itself rather than one cycle late.
+        self.comb += If(
+            counter == self.t_event[3:],
+            self.stb_rising.eq(1),
+            self.fine_ts.eq(self.t_event[:3]),
+        )
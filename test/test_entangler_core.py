@@ -11,7 +11,8 @@ from migen import run_simulation  # noqa: E402
 from migen import Signal  # noqa: E402
 
 from entangler.core import EntanglerCore  # noqa: E402
-from gateware_utils import MockPhy  # noqa: E402 ./helpers/gateware_utils
+from gateware_utils import advance_clock  # noqa: E402 ./helpers/gateware_utils
+from gateware_utils import MockPhy  # noqa: E402
 
 
 class StandaloneHarness(Module):
@@ -26,13 +27,10 @@ class StandaloneHarness(Module):
         self.submodules.phy_apd2 = MockPhy(self.counter)
         self.submodules.phy_apd3 = MockPhy(self.counter)
         self.submodules.phy_ref = MockPhy(self.counter)
-        input_phys = [
-            self.phy_apd0,
-            self.phy_apd1,
-            self.phy_apd2,
-            self.phy_apd3,
-            self.phy_ref,
-        ]
+        # Bound once so generators can index the phys without per-event
+        # getattr/format lookups.
+        self.apd_phys = (self.phy_apd0, self.phy_apd1, self.phy_apd2, self.phy_apd3)
+        input_phys = list(self.apd_phys) + [self.phy_ref]
 
         core_link_pads = None
         output_pads = None
@@ -43,13 +41,19 @@ class StandaloneHarness(Module):
 
         self.comb += self.counter.eq(self.core.msm.m)
 
+    def set_event_times(self, ref_time, apd_times):
+        """Set the reference and per-APD event times, in mu."""
+        yield self.phy_ref.t_event.eq(ref_time)
+        for phy, t_event in zip(self.apd_phys, apd_times):
+            yield phy.t_event.eq(t_event)
+
 
 def standalone_test(dut):
     """Test the standalone :class:``EntanglerCore`` works properly."""
     yield dut.core.msm.m_end.eq(20)
     yield dut.core.msm.is_master.eq(1)
     yield dut.core.msm.standalone.eq(1)
-    yield dut.core.msm.time_remaining.eq(100)
+    yield dut.core.msm.time_remaining_buf.eq(100)
 
     yield dut.core.sequencers[0].m_start.eq(1)
     yield dut.core.sequencers[0].m_stop.eq(9)
@@ -65,36 +69,79 @@ def standalone_test(dut):
     yield dut.core.apd_gaters[1].gate_start.eq(18)
     yield dut.core.apd_gaters[1].gate_stop.eq(30)
 
-    yield dut.phy_ref.t_event.eq(1000)
-    yield dut.phy_apd0.t_event.eq(1000)
-    yield dut.phy_apd1.t_event.eq(1000)
-    yield dut.phy_apd2.t_event.eq(1000)
-    yield dut.phy_apd3.t_event.eq(1000)
+    yield from dut.set_event_times(1000, [1000, 1000, 1000, 1000])
 
     yield dut.core.heralder.patterns[0].eq(0b0101)
     yield dut.core.heralder.pattern_ens[0].eq(1)
 
-    for _ in range(5):
-        yield
+    yield from advance_clock(5)
+    yield dut.core.msm.run_stb.eq(1)
+    yield
+    yield dut.core.msm.run_stb.eq(0)
+
+    yield from advance_clock(50)
+
+    t_ref = 8 * 10 + 3
+    yield from dut.set_event_times(
+        t_ref, [t_ref + 18, t_ref + 30, t_ref + 30, t_ref + 30]
+    )
+
+    yield from advance_clock(50)
+
+
+def herald_boundary_test(dut, event_m, expect_success):
+    """Check whether an event ``event_m`` coarse cycles into a cycle heralds.
+
+    Events reach the herald matcher through two pipeline registers (see the
+    ``EntanglerCore`` docstring), so only events at or before ``m_end - 3``
+    can make the herald decision of the cycle they arrive in. Later events
+    never herald here because the mocked PHYs repeat the same (too-late)
+    event every cycle, so the run must end in a timeout instead.
+    """
+    m_end = 20
+    yield dut.core.msm.m_end.eq(m_end)
+    yield dut.core.msm.is_master.eq(1)
+    yield dut.core.msm.standalone.eq(1)
+    yield dut.core.msm.time_remaining_buf.eq(100)
+
+    yield dut.core.apd_gaters[0].gate_start.eq(8)
+    yield dut.core.apd_gaters[0].gate_stop.eq(8 * m_end)
+    yield dut.core.apd_gaters[1].gate_start.eq(8)
+    yield dut.core.apd_gaters[1].gate_stop.eq(8 * m_end)
+
+    never = 1 << 20  # outside the cycle counter range, so never strobes
+    yield from dut.set_event_times(8 * 2, [8 * event_m, 8 * event_m, never, never])
+
+    yield dut.core.heralder.patterns[0].eq(0b0011)
+    yield dut.core.heralder.pattern_ens[0].eq(1)
+
+    yield from advance_clock(5)
     yield dut.core.msm.run_stb.eq(1)
     yield
     yield dut.core.msm.run_stb.eq(0)
 
-    for _ in range(50):
-        yield
+    yield from advance_clock(200)
 
-    yield dut.phy_ref.t_event.eq(8 * 10 + 3)
-    yield dut.phy_apd0.t_event.eq(8 * 10 + 3 + 18)
-    yield dut.phy_apd1.t_event.eq(8 * 10 + 3 + 30)
-    yield dut.phy_apd2.t_event.eq(8 * 10 + 3 + 30)
-    yield dut.phy_apd3.t_event.eq(8 * 10 + 3 + 30)
+    assert (yield dut.core.msm.success) == expect_success
+    assert (yield dut.core.msm.timeout) == (not expect_success)
 
-    for _ in range(50):
-        yield
+
+def test_standalone():
+    """Run the standalone sequence under pytest (no VCD)."""
+    dut = StandaloneHarness()
+    run_simulation(dut, standalone_test(dut), clocks={"sys": 8})
+
+
+def test_herald_latency_boundary():
+    """Events in the last two coarse cycles must not make the herald."""
+    for event_m, expect_success in [(17, True), (18, False)]:
+        dut = StandaloneHarness()
+        run_simulation(
+            dut, herald_boundary_test(dut, event_m, expect_success), clocks={"sys": 8}
+        )
 
 
 if __name__ == "__main__":
+    vcd = "core_standalone.vcd" if os.environ.get("ENTANGLER_VCD") else None
     dut = StandaloneHarness()
-    run_simulation(
-        dut, standalone_test(dut), vcd_name="core_standalone.vcd", clocks={"sys": 8}
-    )
+    run_simulation(dut, standalone_test(dut), vcd_name=vcd, clocks={"sys": 8})
@@ -12,7 +12,8 @@ from migen import Signal  # noqa: E402
 from migen import run_simulation  # noqa: E402
 
 from entangler.core import TriggeredInputGater  # noqa: E402
-from gateware_utils import MockPhy  # noqa: E402 pylint: disable=import-error
+from gateware_utils import advance_clock  # noqa: E402 pylint: disable=import-error
+from gateware_utils import MockPhy  # noqa: E402
 
 
 class TriggeredGaterHarness(Module):
@@ -32,6 +33,18 @@ class TriggeredGaterHarness(Module):
         self.comb += core.clear.eq(self.rst)
 
 
+def gater_cases(dut, cases):
+    """Run several gater scenarios back-to-back on one elaborated harness.
+
+    Elaboration and simulator construction dominate the cost of each
+    ``run_simulation`` call, so the scenarios are chained into a single
+    generator; :func:`gater_test` already resets the counter and gater
+    state between cases via ``dut.rst``.
+    """
+    for case in cases:
+        yield from gater_test(dut, *case)
+
+
 def gater_test(dut, gate_start=None, gate_stop=None, t_ref=None, t_sig=None):
     """Test a ``TriggeredInputGater`` correctly registers inputs."""
     yield dut.core.gate_start.eq(gate_start)
@@ -44,8 +57,7 @@ def gater_test(dut, gate_start=None, gate_stop=None, t_ref=None, t_sig=None):
     yield
     yield dut.rst.eq(0)
 
-    for _ in range(20):
-        yield
+    yield from advance_clock(20)
 
     triggered = (yield dut.core.triggered)
 
@@ -60,29 +72,20 @@ def gater_test(dut, gate_start=None, gate_stop=None, t_ref=None, t_sig=None):
 
 
 if __name__ == "__main__":
-    dut = TriggeredGaterHarness()
-    run_simulation(dut, gater_test(dut, 20, 30, 20, 41), vcd_name="gater.vcd")
-
     gate_start = 8
     gate_stop = 25
     t_ref = 20
 
+    # The window boundary cases around gate_start/gate_stop plus one
+    # fine-timestamp case, all on one elaborated harness.
+    cases = [
+        (20, 30, 20, 41),
+        (gate_start, gate_stop, t_ref, t_ref + gate_start - 1),
+        (gate_start, gate_stop, t_ref, t_ref + gate_start),
+        (gate_start, gate_stop, t_ref, t_ref + gate_stop),
+        (gate_start, gate_stop, t_ref, t_ref + gate_stop + 1),
+    ]
+
+    vcd = "gater.vcd" if os.environ.get("ENTANGLER_VCD") else None
     dut = TriggeredGaterHarness()
-    run_simulation(
-        dut, gater_test(dut, gate_start, gate_stop, t_ref, t_ref + gate_start - 1)
-    )
-
-    dut = TriggeredGaterHarness()
-    run_simulation(
-        dut, gater_test(dut, gate_start, gate_stop, t_ref, t_ref + gate_start)
-    )
-
-    dut = TriggeredGaterHarness()
-    run_simulation(
-        dut, gater_test(dut, gate_start, gate_stop, t_ref, t_ref + gate_stop)
-    )
-
-    dut = TriggeredGaterHarness()
-    run_simulation(
-        dut, gater_test(dut, gate_start, gate_stop, t_ref, t_ref + gate_stop + 1)
-    )
+    run_simulation(dut, gater_cases(dut, cases), vcd_name=vcd)
@@ -1,4 +1,5 @@
 """Test the :class:`entangler.core.PatternMatcher` properly pattern matches."""
+import os
 from migen import run_simulation
 
 from entangler.core import PatternMatcher
@@ -24,6 +25,24 @@ def pattern_match_test(dut):
             )
 
 
+def pattern_mask_test(dut):
+    """Test don't-care masking in the :class:`PatternMatcher`."""
+    mask = 0b1110  # LSB is a don't-care
+    yield dut.patterns[0].eq(patterns[0])
+    yield dut.pattern_masks[0].eq(mask)
+    yield dut.pattern_ens.eq(0b0001)
+    yield
+
+    for i in range(2 ** n_sig):
+        yield dut.sig.eq(i)
+        yield
+        assert (yield dut.is_match) == ((i & mask) == (patterns[0] & mask))
+
+
 if __name__ == "__main__":
+    vcd = "heralder.vcd" if os.environ.get("ENTANGLER_VCD") else None
+    dut = PatternMatcher(num_inputs=n_sig, num_patterns=len(patterns))
+    run_simulation(dut, pattern_match_test(dut), vcd_name=vcd)
+
     dut = PatternMatcher(num_inputs=n_sig, num_patterns=len(patterns))
-    run_simulation(dut, pattern_match_test(dut), vcd_name="heralder.vcd")
+    run_simulation(dut, pattern_mask_test(dut))
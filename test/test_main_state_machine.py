@@ -1,4 +1,5 @@
 """Test the entangler state machine logic in :class`entangler.core.MainStateMachine`."""
+import os
 from migen import Module
 from migen import run_simulation
 
@@ -153,8 +154,16 @@ def msm_pair_test(dut):
 
 
 if __name__ == "__main__":
+    want_vcd = os.environ.get("ENTANGLER_VCD")
+
     dut = MsmPair()
-    run_simulation(dut, msm_pair_test(dut), vcd_name="msm_pair.vcd")
+    run_simulation(
+        dut, msm_pair_test(dut), vcd_name="msm_pair.vcd" if want_vcd else None
+    )
 
     dut = MainStateMachine()
-    run_simulation(dut, msm_standalone_test(dut), vcd_name="msm_standalone.vcd")
+    run_simulation(
+        dut,
+        msm_standalone_test(dut),
+        vcd_name="msm_standalone.vcd" if want_vcd else None,
+    )
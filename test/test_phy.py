@@ -10,7 +10,8 @@ from migen import Module  # noqa: E402
 from migen import run_simulation  # noqa: E402
 from migen import Signal  # noqa: E402
 
-from gateware_utils import MockPhy  # noqa: E402 ./helpers/gateware_utils
+from gateware_utils import advance_clock  # noqa: E402 ./helpers/gateware_utils
+from gateware_utils import MockPhy  # noqa: E402
 from gateware_utils import rtio_output_event  # noqa: E402
 from entangler.phy import Entangler  # noqa: E402
 
@@ -52,26 +53,27 @@ ADDR_HERALDS = 3
 ADDR_TIMING = 0b1000
 
 
-def test_basic(dut):
-    """Test the entire :mod:`entangler` gateware basic functionality works."""
+def basic_test(dut):
+    """Test the entire :mod:`entangler` gateware basic functionality works.
+
+    This is a simulation generator driven by ``run_simulation``, not a pytest
+    test function (pytest cannot collect generator tests).
+    """
     # Helper functions for state machine testing
     def out(addr, data):
         yield from rtio_output_event(dut.core.rtlink, addr, data)
 
     def write_heralds(heralds=None):
-        data = 0
-        for i, h in enumerate(heralds):
-            assert i < 4
-            data |= (1 << i) << (4 * 4)
-            data |= h << (4 * i)
+        assert len(heralds) <= 4
+        # Enable bit in [16:20], 4-bit pattern in [4*i : 4*(i+1)].
+        data = sum((1 << (16 + i)) | (h << (4 * i)) for i, h in enumerate(heralds))
         yield from out(ADDR_HERALDS, data)
 
     yield dut.phy_ref.t_event.eq(1000)
     yield dut.phy_apd0.t_event.eq(1000)
     yield dut.phy_apd1.t_event.eq(1000)
 
-    for _ in range(5):
-        yield
+    yield from advance_clock(5)
     yield from out(ADDR_CONFIG, 0b110)  # disable, standalone
     yield from write_heralds([0b0101, 0b1010, 0b1100, 0b0101])
     for i in range(4):
@@ -84,12 +86,11 @@ def test_basic(dut):
     yield from out(ADDR_CONFIG, 0b111)  # Enable standalone
     yield from out(ADDR_RUN, int(2e3 / 8))
 
-    for i in range(1000):
-        # if i==200:
-        #     yield dut.phy_ref.t_event.eq( 8*10+3 )
-        #     yield dut.phy_apd0.t_event.eq( 8*10+3 + 18)
-        #     yield dut.phy_apd1.t_event.eq( 8*10+3 + 30)
-        yield
+    # if i==200:
+    #     yield dut.phy_ref.t_event.eq( 8*10+3 )
+    #     yield dut.phy_apd0.t_event.eq( 8*10+3 + 18)
+    #     yield dut.phy_apd1.t_event.eq( 8*10+3 + 30)
+    yield from advance_clock(1000)
 
     yield from out(0b10000, 0)  # Read status
     yield
@@ -100,15 +101,15 @@ def test_basic(dut):
     for i in range(5):
         yield from out(0b11000 + i, 0)  # Read input timestamps
         yield
-    for _ in range(5):
-        yield
+    yield from advance_clock(5)
 
 
-def test_timeout(dut):
+def timeout_test(dut):
     """Test that :mod:`entangler` timeout works.
 
     Sweeps the timeout is swept to occur at all possible points in the
-    state machine operation.
+    state machine operation. Like :func:`basic_test`, this is a simulation
+    generator, not a collectable pytest test.
     """
     # Declare internal helper functions.
     def out(addr, data):
@@ -140,11 +141,18 @@ def test_timeout(dut):
 
 if __name__ == "__main__":
     dut = PhyHarness()
+    want_vcd = os.environ.get("ENTANGLER_VCD")
     run_simulation(
-        dut, test_basic(dut), vcd_name="phy.vcd", clocks={"sys": 8, "rio": 8}
+        dut,
+        basic_test(dut),
+        vcd_name="phy.vcd" if want_vcd else None,
+        clocks={"sys": 8, "rio": 8}
     )
 
     dut = PhyHarness()
     run_simulation(
-        dut, test_timeout(dut), vcd_name="phy_timeout.vcd", clocks={"sys": 8, "rio": 8}
+        dut,
+        timeout_test(dut),
+        vcd_name="phy_timeout.vcd" if want_vcd else None,
+        clocks={"sys": 8, "rio": 8}
     )
@@ -1,4 +1,5 @@
 """Test the output event scheduler :class:`entangler.core.ChannelSequencer`."""
+import os
 from migen import Module
 from migen import run_simulation
 from migen import Signal
@@ -28,17 +29,16 @@ def channel_sequencer_test(dut):
         yield
 
         if i == 10:
-            assert (yield dut.core.stb_start) == 1
             assert (yield dut.core.output) == 0
         if i == 11:
             assert (yield dut.core.output) == 1
         if i == 30:
-            assert (yield dut.core.stb_stop) == 1
             assert (yield dut.core.output) == 1
         if i == 31:
             assert (yield dut.core.output) == 0
 
 
 if __name__ == "__main__":
+    vcd = "sequencer.vcd" if os.environ.get("ENTANGLER_VCD") else None
     dut = ChannelSequencerHarness()
-    run_simulation(dut, channel_sequencer_test(dut), vcd_name="sequencer.vcd")
+    run_simulation(dut, channel_sequencer_test(dut), vcd_name=vcd)